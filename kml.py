@@ -27,14 +27,19 @@ class KmlExporter:
         kml_file (str): Path to output KML file.
         kml (simplekml.Kml): KML document object.
         kml_folders (Dict[str, simplekml.Folder]): Folders for event types.
+        kml_points (Dict[str, simplekml.Point]): Maps KML point IDs to the points added.
+        line_styles (Dict[str, simplekml.Style]): Shared line styles, keyed by colour.
+        marker_styles (Dict[str, simplekml.Style]): Shared placemark styles, keyed by marker type.
         marker_style (Dict[str, dict]): Marker style configuration.
         line_types (List[str]): Types of lines to draw (e.g., parent links).
+        pretty_print (bool): Whether to indent the saved KML (much slower for large files).
     """
 
     __slots__ = [
-        'kml_file', 'kml', 'kml_folders'
+        'kml_file', 'kml', 'kml_folders', 'kml_points', 'line_styles', 'marker_styles'
     ]
     line_width = 2
+    pretty_print = False
     timespan_default_start_year = 1950
     timespan_default_range_years = 100
     marker_style = {
@@ -60,11 +65,15 @@ class KmlExporter:
         self.kml_file = kml_file
         self.kml = simplekml.Kml()
         self.kml_folders = dict()
-
-        for marker_type in self.marker_style.keys():
-            self.marker_style[marker_type]['style'] = simplekml.Style()
-            self.marker_style[marker_type]['style'].iconstyle.icon.href = self.marker_style[marker_type]['icon_href']
-            self.marker_style[marker_type]['style'].name = marker_type
+        self.kml_points = dict()
+        self.line_styles = dict()
+        self.marker_styles = dict()
+
+        for marker_type, marker_settings in self.marker_style.items():
+            style = simplekml.Style()
+            style.iconstyle.icon.href = marker_settings['icon_href']
+            style.name = marker_type
+            self.marker_styles[marker_type] = style
             self.kml_folders[marker_type] = self.kml.newfolder(name=marker_type)
         for line_type in self.line_types:
             self.kml_folders[line_type] = self.kml.newfolder(name=line_type)
@@ -77,7 +86,7 @@ class KmlExporter:
             logger.error('KML not initialised')
         else:
             logger.info(f'Saving KML file: {self.kml_file}')
-            self.kml.save(self.kml_file)
+            self.kml.save(self.kml_file, format=self.pretty_print)
 
     def add_point(self, marker_type: str, name: str, lat_lon: LatLon, timestamp: str, description: str) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -103,10 +112,12 @@ class KmlExporter:
             )
             if timestamp:
                 pnt.timestamp.when = timestamp
-            if marker_type in self.marker_style.keys():
-                pnt.style = self.marker_style[marker_type]['style']
+            style = self.marker_styles.get(marker_type)
+            if style:
+                pnt.style = style
             point_id = pnt.id
             placemark_id = pnt.placemark.id
+            self.kml_points[point_id] = pnt
         return placemark_id, point_id
 
     def draw_line(self, line_type: str, name: str, begin_lat_lon: LatLon, end_lat_lon: LatLon,
@@ -138,10 +149,30 @@ class KmlExporter:
             kml_line.altitudemode   = simplekml.AltitudeMode.clamptoground
             kml_line.extrude        = 1
             kml_line.tessellate     = 1
-            kml_line.style.linestyle.color  = colour
-            kml_line.style.linestyle.width  = self.line_width
+            kml_line.style          = self._line_style(colour)
             return kml_line.id
         return None
+
+    def _line_style(self, colour: simplekml.Color) -> simplekml.Style:
+        """
+        Get the shared line style for a colour, creating it on first use.
+
+        Sharing one style per colour means it is written to the KML once and
+        referenced by each line, rather than repeated inline for every line.
+
+        Args:
+            colour (simplekml.Color): Line color.
+
+        Returns:
+            simplekml.Style: Shared style for lines of this colour.
+        """
+        style = self.line_styles.get(colour)
+        if style is None:
+            style = simplekml.Style()
+            style.linestyle.color = colour
+            style.linestyle.width = self.line_width
+            self.line_styles[colour] = style
+        return style
     
     def lookat(self, lat_lon: LatLon, begin_year: int, end_year: int, altitude=0, range=1000, heading=0, tilt=0) -> None:
         """
@@ -202,7 +233,7 @@ class KML_Life_Lines_Creator:
         self.use_hyperlinks = use_hyperlinks
         self.main_person_id = main_person_id
 
-    def _add_point(self, current: Person, event, event_type: str) -> None:
+    def _add_point(self, current: Person, event, event_type: str, lat_lon: LatLon) -> None:
         """
         Add a placemark for a person's event (birth, marriage, death).
 
@@ -210,15 +241,14 @@ class KML_Life_Lines_Creator:
             current (Person): The person.
             event: The event object.
             event_type (str): Type of event.
+            lat_lon (LatLon): Valid location of the event.
         """
-        location = getattr(event, 'location', None)
-        lat_lon = getattr(location, 'latlon', None)
-        if event and lat_lon and lat_lon.is_valid():
-            description =  f'{event_type} {event.date.year_num}<br>{event.place}<br>'
-            placemark_id, point_id = self.kml_instance.add_point(event_type, current.name, lat_lon, event.date.year_num, description)
-            self.kml_point_to_person_lookup[point_id] = current.xref_id
-            self.kml_person_to_point_lookup[current.xref_id] = point_id
-            self.kml_person_to_placemark_lookup[current.xref_id] = placemark_id
+        year = event.date.year_num
+        description = f'{event_type} {year}<br>{event.place}<br>'
+        placemark_id, point_id = self.kml_instance.add_point(event_type, current.name, lat_lon, year, description)
+        self.kml_point_to_person_lookup[point_id] = current.xref_id
+        self.kml_person_to_point_lookup[current.xref_id] = point_id
+        self.kml_person_to_placemark_lookup[current.xref_id] = placemark_id
 
     def add_person(self, current: Person) -> None:
         """
@@ -227,14 +257,13 @@ class KML_Life_Lines_Creator:
         Args:
             current (Person): The person.
         """
-        birth_event = getattr(current, 'birth', None)
-        if birth_event and getattr(birth_event, 'location', None) and getattr(birth_event.location, 'latlon', None) and birth_event.location.latlon.is_valid():
-            self._add_point(current, birth_event, "Birth")
-        for marriage_event in getattr(current, 'marriages', []):
-            if marriage_event and getattr(marriage_event, 'location', None) and getattr(marriage_event.location, 'latlon', None) and marriage_event.location.latlon.is_valid():
-                self._add_point(current, marriage_event, "Marriage")
-        if getattr(current, 'death', None) and getattr(current.death, 'location', None) and getattr(current.death.location, 'latlon', None) and current.death.location.latlon.is_valid():
-            self._add_point(current, current.death, "Death")
+        events = [(getattr(current, 'birth', None), 'Birth')]
+        events.extend((marriage_event, 'Marriage') for marriage_event in getattr(current, 'marriages', []))
+        events.append((getattr(current, 'death', None), 'Death'))
+        for event, event_type in events:
+            lat_lon = getattr(getattr(event, 'location', None), 'latlon', None)
+            if lat_lon and lat_lon.is_valid():
+                self._add_point(current, event, event_type, lat_lon)
 
     def update_person_description(self, point: simplekml.featgeom.Point, current: Person) -> None:
         """
@@ -244,71 +273,95 @@ class KML_Life_Lines_Creator:
             point (simplekml.featgeom.Point): KML point.
             current (Person): The person.
         """
-        description = point.description
+        people = self.gedcom.people
+        point_lookup = self.kml_person_to_point_lookup
+        placemark_lookup = self.kml_person_to_placemark_lookup
+        parts = [point.description]
         birth_event = getattr(current, 'birth', None)
         if birth_event and getattr(birth_event, 'location', None) and getattr(birth_event.location, 'latlon', None) and birth_event.location.latlon.is_valid():
-            if current.father and (current.father in self.kml_person_to_point_lookup):
-                father_id = self.kml_person_to_placemark_lookup.get(current.father)
-                if father_id and current.father in self.gedcom.people:
+            if current.father and (current.father in point_lookup):
+                father_id = placemark_lookup.get(current.father)
+                if father_id and current.father in people:
                     if self.use_hyperlinks:
-                        description += f'Father: <a href=#{father_id};balloonFlyto>{self.gedcom.people[current.father].name}</a><br>'
+                        parts.append(f'Father: <a href=#{father_id};balloonFlyto>{people[current.father].name}</a><br>')
                     else:
-                        description += f'Father: {self.gedcom.people[current.father].name}<br>'
-            if current.mother and (current.mother in self.kml_person_to_point_lookup):
-                mother_id = self.kml_person_to_placemark_lookup.get(current.mother)
-                if mother_id and current.mother in self.gedcom.people:
+                        parts.append(f'Father: {people[current.father].name}<br>')
+            if current.mother and (current.mother in point_lookup):
+                mother_id = placemark_lookup.get(current.mother)
+                if mother_id and current.mother in people:
                     if self.use_hyperlinks:
-                        description += f'Mother: <a href=#{mother_id};balloonFlyto>{self.gedcom.people[current.mother].name}</a><br>'
+                        parts.append(f'Mother: <a href=#{mother_id};balloonFlyto>{people[current.mother].name}</a><br>')
                     else:
-                        description += f'Mother: {self.gedcom.people[current.mother].name}<br>'
+                        parts.append(f'Mother: {people[current.mother].name}<br>')
             if getattr(current, 'children', None):
-                description += 'Children: '
+                parts.append('Children: ')
                 for child in current.children:
-                    if child in self.kml_person_to_placemark_lookup and child in self.gedcom.people:
-                        child_id = self.kml_person_to_placemark_lookup[child]
-                        description += f'<a href=#{child_id};balloonFlyto>{self.gedcom.people[child].name}</a> '
-                    elif child in self.gedcom.people:
-                        description += f'{self.gedcom.people[child].name} '
-        point.description = description
+                    if child in placemark_lookup and child in people:
+                        parts.append(f'<a href=#{placemark_lookup[child]};balloonFlyto>{people[child].name}</a> ')
+                    elif child in people:
+                        parts.append(f'{people[child].name} ')
+        point.description = ''.join(parts)
 
     def add_people(self) -> None:
         """
         Add all people from the GEDCOM to the KML.
         """
-        for person_id, person in self.gedcom.people.items():
+        for person in self.gedcom.people.values():
             self.add_person(person)
 
-        for g in self.kml_instance.kml.allgeometries:
-            person = self.gedcom.people[self.kml_point_to_person_lookup.get(g.id)]
-            self.update_person_description(g, person)
+        for point_id, person_id in self.kml_point_to_person_lookup.items():
+            self.update_person_description(self.kml_instance.kml_points[point_id], self.gedcom.people[person_id])
 
-    def connect_parents(self) -> None:
+    def _located_people(self) -> Dict[str, Tuple[LatLon, Optional[int]]]:
         """
-        Draw lines connecting each person to their parents.
+        Collect people with a valid location, along with their birth year.
+
+        Built once per pass so that each parent's location and birth year are
+        resolved a single time, rather than once for every child.
+
+        Returns:
+            Dict[str, Tuple[LatLon, Optional[int]]]: Maps person xref ID to (latlon, birth year).
         """
-        line_type = 'Parents'
+        located = dict()
         for person_id, person in self.gedcom.people.items():
-            birth_event = getattr(person, 'birth', None)
             if person.latlon and person.latlon.is_valid():
-                begin_date = birth_event.date.year_num if birth_event and birth_event.date else None
-
-                if person.father:
-                    father = self.gedcom.people[person.father]
-                    line_name = f'Father: {father.name}'
-                    father_birth_event = getattr(father, 'birth', None)
-                    if father.latlon and father.latlon.is_valid():
-                        end_date = father_birth_event.date.year_num if father_birth_event and father_birth_event.date else None
-                        self.kml_instance.draw_line(line_type, line_name, person.latlon, father.latlon,
-                                                    begin_date, end_date, simplekml.Color.blue)
-
-                if person.mother:
-                    mother = self.gedcom.people[person.mother]
-                    line_name = f'Mother: {mother.name}'
-                    mother_birth_event = getattr(mother, 'birth', None)
-                    if mother.latlon and mother.latlon.is_valid():
-                        end_date = mother_birth_event.date.year_num if mother_birth_event and mother_birth_event.date else None
-                        self.kml_instance.draw_line(line_type, line_name, person.latlon, mother.latlon,
-                                                    begin_date, end_date, simplekml.Color.red)
+                birth_event = getattr(person, 'birth', None)
+                birth_year = birth_event.date.year_num if birth_event and birth_event.date else None
+                located[person_id] = (person.latlon, birth_year)
+        return located
+
+    def _connect_parent(self, located: Dict[str, Tuple[LatLon, Optional[int]]], relation: str,
+                        parent_id: Optional[str], latlon: LatLon, begin_date: Optional[int],
+                        colour: simplekml.Color) -> None:
+        """
+        Draw a line from a person to one parent, if the parent has a valid location.
+
+        Args:
+            located (Dict[str, Tuple[LatLon, Optional[int]]]): People with a valid location.
+            relation (str): Relation label ('Father' or 'Mother').
+            parent_id (Optional[str]): Parent's xref ID.
+            latlon (LatLon): Person's location.
+            begin_date (Optional[int]): Person's birth year.
+            colour (simplekml.Color): Line color.
+        """
+        parent = located.get(parent_id)
+        if parent is None:
+            return
+        parent_latlon, end_date = parent
+        line_name = f'{relation}: {self.gedcom.people[parent_id].name}'
+        self.kml_instance.draw_line('Parents', line_name, latlon, parent_latlon,
+                                    begin_date, end_date, colour)
+
+    def connect_parents(self) -> None:
+        """
+        Draw lines connecting each person to their parents.
+        """
+        people = self.gedcom.people
+        located = self._located_people()
+        for person_id, (latlon, begin_date) in located.items():
+            person = people[person_id]
+            self._connect_parent(located, 'Father', person.father, latlon, begin_date, simplekml.Color.blue)
+            self._connect_parent(located, 'Mother', person.mother, latlon, begin_date, simplekml.Color.red)
 
     def lookat_person(self, person_id: str) -> None:
         """